@@ -4,27 +4,38 @@ FastAPI backend for Relaysim test harness.
 Provides REST API for running scenarios and viewing results.
 """
 
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from ..runner import ScenarioResult, TestRunner, YAMLScenarioLoader
 from ..simulator import DeviceSimulator
 from ..reports import ReportGenerator
-from ..utils import setup_logger
+from ..utils import json_default, setup_logger
 
 # Setup logging
 logger = setup_logger("relaysim.api", level="INFO")
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Relaysim API",
     description="Automated Firmware Test Harness API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for frontend access
@@ -36,8 +47,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Maximum number of run results kept in memory
+MAX_STORED_RUNS = 1000
+
+
+class RunResultStore(OrderedDict):
+    """In-memory run storage that evicts the oldest runs past a size cap."""
+
+    def __init__(self, maxsize: int = MAX_STORED_RUNS):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: str, value: ScenarioResult) -> None:
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 # In-memory storage for run results
-run_results: Dict[str, ScenarioResult] = {}
+run_results: Dict[str, ScenarioResult] = RunResultStore()
+
+# Idle device used to report default status; never commanded by the API
+status_device = DeviceSimulator()
+
+# Shared loader and report generator, created once at startup
+scenario_loader = YAMLScenarioLoader()
+report_generator = ReportGenerator()
 
 
 # Request/Response Models
@@ -109,16 +144,18 @@ async def root():
 
 
 @app.get("/api/scenarios", response_model=List[ScenarioInfo])
-async def list_scenarios():
+def list_scenarios():
     """
     Get list of available test scenarios.
 
+    Declared sync so FastAPI runs the directory scan and YAML parsing in
+    its threadpool instead of on the event loop.
+
     Returns:
         List of scenario information
     """
     try:
-        loader = YAMLScenarioLoader()
-        scenarios = loader.list_scenarios()
+        scenarios = scenario_loader.list_scenarios()
 
         return [
             ScenarioInfo(
@@ -134,12 +171,15 @@ async def list_scenarios():
 
 
 @app.post("/api/run", response_model=RunResultResponse)
-async def run_scenario(request: RunScenarioRequest):
+async def run_scenario(request: RunScenarioRequest, background_tasks: BackgroundTasks):
     """
     Run a test scenario.
 
+    The JSON report is written after the response has been sent.
+
     Args:
         request: Run request with scenario name
+        background_tasks: Tasks to run once the response is sent
 
     Returns:
         Scenario run result
@@ -150,17 +190,17 @@ async def run_scenario(request: RunScenarioRequest):
     try:
         # Create fresh device and runner for this execution
         device = DeviceSimulator()
-        runner = TestRunner(device)
+        runner = TestRunner(device, loader=scenario_loader)
 
-        # Run the scenario
-        result = runner.run_scenario(scenario_name)
+        # Run the scenario in the threadpool; wait steps and device delays
+        # block, and must not stall the event loop
+        result = await run_in_threadpool(runner.run_scenario, scenario_name)
 
         # Store result
         run_results[result.run_id] = result
 
-        # Generate report
-        report_gen = ReportGenerator()
-        report_gen.generate_json_report(result)
+        # Generate report off the request path
+        background_tasks.add_task(report_generator.generate_json_report, result)
 
         # Log summary
         logger.info(f"Scenario '{scenario_name}' completed with status: {result.overall_status}")
@@ -173,18 +213,22 @@ async def run_scenario(request: RunScenarioRequest):
         raise HTTPException(status_code=500, detail=f"Failed to run scenario: {str(e)}")
 
 
-@app.get("/api/runs", response_model=List[RunResultResponse])
+@app.get("/api/runs", responses={200: {"model": List[RunResultResponse]}})
 async def list_runs():
     """
     Get list of all scenario runs.
 
+    Each run contributes its cached JSON bytes, so the list is assembled
+    without re-encoding stored results.
+
     Returns:
         List of all run results
     """
-    return [_convert_to_response(result) for result in run_results.values()]
+    payload = b"[" + b",".join(result.to_json_bytes() for result in run_results.values()) + b"]"
+    return Response(content=payload, media_type="application/json")
 
 
-@app.get("/api/runs/{run_id}", response_model=RunResultResponse)
+@app.get("/api/runs/{run_id}", responses={200: {"model": RunResultResponse}})
 async def get_run(run_id: str):
     """
     Get details of a specific run.
@@ -198,7 +242,7 @@ async def get_run(run_id: str):
     if run_id not in run_results:
         raise HTTPException(status_code=404, detail=f"Run '{run_id}' not found")
 
-    return _convert_to_response(run_results[run_id])
+    return Response(content=run_results[run_id].to_json_bytes(), media_type="application/json")
 
 
 @app.delete("/api/runs/{run_id}")
@@ -241,13 +285,13 @@ async def get_device_status():
     """
     Get current device status.
 
-    Note: This creates a fresh device instance for status checking.
+    Note: This reports a shared idle device instance; scenario runs use
+    their own devices.
 
     Returns:
         Device status
     """
-    device = DeviceSimulator()
-    status = device.get_status()
+    status = status_device.get_status()
 
     return DeviceStatusResponse(
         state=status["state"],
@@ -261,27 +305,17 @@ async def get_device_status():
 # Helper Functions
 
 def _convert_to_response(result: ScenarioResult) -> RunResultResponse:
-    """Convert ScenarioResult to API response model."""
+    """
+    Convert ScenarioResult to API response model.
+
+    The data comes from our own runner, so validation is skipped.
+    """
     result_dict = result.to_dict()
+    result_dict["step_results"] = [
+        StepResultResponse.model_construct(**step) for step in result_dict["step_results"]
+    ]
 
-    return RunResultResponse(
-        run_id=result_dict["run_id"],
-        scenario_name=result_dict["scenario_name"],
-        description=result_dict["description"],
-        start_time=result_dict["start_time"],
-        start_datetime=result_dict["start_datetime"],
-        end_time=result_dict["end_time"],
-        end_datetime=result_dict["end_datetime"],
-        duration_seconds=result_dict["duration_seconds"],
-        overall_status=result_dict["overall_status"],
-        error_message=result_dict["error_message"],
-        total_steps=result_dict["total_steps"],
-        passed_steps=result_dict["passed_steps"],
-        failed_steps=result_dict["failed_steps"],
-        step_results=[
-            StepResultResponse(**step) for step in result_dict["step_results"]
-        ]
-    )
+    return RunResultResponse.model_construct(**result_dict)
 
 
 # Startup/Shutdown Events
@@ -2,16 +2,35 @@
 Report generation for test scenario results.
 """
 
-import json
+import io
+import os
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from ..runner import ScenarioResult
-from ..utils import get_logger
+from ..utils import get_logger, json_default
 
 logger = get_logger()
 
+# Overall status display used in single-scenario summaries
+_STATUS_LABELS = {
+    "passed": "✓ PASSED",
+    "failed": "✗ FAILED",
+    "error": "⚠ ERROR",
+    "running": "⋯ RUNNING",
+}
+
+# Overall status markers used in batch summaries
+_STATUS_SYMBOLS = {
+    "passed": "✓",
+    "failed": "✗",
+    "error": "⚠",
+}
+
 
 class ReportGenerator:
     """Generates reports from scenario results."""
@@ -46,8 +65,11 @@ class ReportGenerator:
         Returns:
             Path to the generated report file
         """
+        # One clock read for both the filename and the report metadata
+        now = datetime.now()
+
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"{result.scenario_name}_{timestamp}.json"
 
         report_path = self.output_dir / filename
@@ -55,11 +77,28 @@ class ReportGenerator:
         report_data = result.to_dict()
 
         # Add report metadata
-        report_data["report_generated_at"] = datetime.now().isoformat()
+        report_data["report_generated_at"] = now.isoformat()
         report_data["report_version"] = "1.0"
 
-        with open(report_path, "w") as f:
-            json.dump(report_data, f, indent=2)
+        # Write to a uniquely named temporary file and swap it in so readers
+        # never see a partially written report, even when concurrent runs
+        # target the same report name
+        payload = orjson.dumps(
+            report_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=json_default,
+        )
+        tmp_path = report_path.with_name(f"{report_path.name}.{uuid.uuid4().hex}.tmp")
+        # O_EXCL guarantees the file is ours; mode 0o666 lets the umask decide
+        # permissions, as a plain open() would
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, report_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         logger.info(f"JSON report generated: {report_path}")
         return report_path
@@ -74,56 +113,52 @@ class ReportGenerator:
         Returns:
             Formatted summary string
         """
-        lines = []
-        lines.append("=" * 70)
-        lines.append(f"SCENARIO: {result.scenario_name}")
+        buf = io.StringIO()
+        w = buf.write
+
+        w("=" * 70 + "\n")
+        w(f"SCENARIO: {result.scenario_name}\n")
         if result.description:
-            lines.append(f"Description: {result.description}")
-        lines.append("=" * 70)
-        lines.append("")
+            w(f"Description: {result.description}\n")
+        w("=" * 70 + "\n")
+        w("\n")
 
         # Overall status
-        status_symbol = {
-            "passed": "✓ PASSED",
-            "failed": "✗ FAILED",
-            "error": "⚠ ERROR",
-            "running": "⋯ RUNNING",
-        }
-        lines.append(f"Status: {status_symbol.get(result.overall_status, result.overall_status)}")
+        w(f"Status: {_STATUS_LABELS.get(result.overall_status, result.overall_status)}\n")
 
         # Timing
-        lines.append(f"Duration: {result.duration_seconds:.3f}s")
+        w(f"Duration: {result.duration_seconds:.3f}s\n")
         start_dt = datetime.fromtimestamp(result.start_time).strftime("%Y-%m-%d %H:%M:%S")
-        lines.append(f"Started: {start_dt}")
+        w(f"Started: {start_dt}\n")
 
         # Step summary
-        lines.append(f"\nSteps: {result.passed_steps}/{len(result.step_results)} passed")
+        w(f"\nSteps: {result.passed_steps}/{len(result.step_results)} passed\n")
         if result.failed_steps > 0:
-            lines.append(f"Failed: {result.failed_steps}")
+            w(f"Failed: {result.failed_steps}\n")
 
         # Error message if any
         if result.error_message:
-            lines.append(f"\nError: {result.error_message}")
+            w(f"\nError: {result.error_message}\n")
 
-        lines.append("")
-        lines.append("-" * 70)
-        lines.append("STEP DETAILS:")
-        lines.append("-" * 70)
+        w("\n")
+        w("-" * 70 + "\n")
+        w("STEP DETAILS:\n")
+        w("-" * 70 + "\n")
 
         # Step details
         for step_result in result.step_results:
             status_icon = "✓" if step_result.status == "pass" else "✗"
-            lines.append(
+            w(
                 f"  [{status_icon}] Step {step_result.step_number}: {step_result.step_type} "
-                f"({step_result.duration_ms:.1f}ms)"
+                f"({step_result.duration_ms:.1f}ms)\n"
             )
             if step_result.message and step_result.status != "pass":
-                lines.append(f"      Message: {step_result.message}")
+                w(f"      Message: {step_result.message}\n")
 
-        lines.append("")
-        lines.append("=" * 70)
+        w("\n")
+        w("=" * 70)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def generate_batch_summary(self, results: list[ScenarioResult]) -> str:
         """
@@ -154,18 +189,12 @@ class ReportGenerator:
 
         # Individual scenario status
         lines.append("-" * 70)
-        for result in results:
-            status_symbol = {
-                "passed": "✓",
-                "failed": "✗",
-                "error": "⚠",
-            }
-            symbol = status_symbol.get(result.overall_status, "?")
-            lines.append(
-                f"  [{symbol}] {result.scenario_name} "
-                f"({result.duration_seconds:.3f}s, "
-                f"{result.passed_steps}/{len(result.step_results)} steps)"
-            )
+        lines.extend(
+            f"  [{_STATUS_SYMBOLS.get(result.overall_status, '?')}] {result.scenario_name} "
+            f"({result.duration_seconds:.3f}s, "
+            f"{result.passed_steps}/{len(result.step_results)} steps)"
+            for result in results
+        )
 
         lines.append("")
         lines.append("=" * 70)
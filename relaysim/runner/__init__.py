@@ -5,6 +5,7 @@ from .yaml_loader import (
     ScenarioLoadError,
     ScenarioValidationError,
     YAMLScenarioLoader,
+    thaw_scenario_data,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "YAMLScenarioLoader",
     "ScenarioLoadError",
     "ScenarioValidationError",
+    "thaw_scenario_data",
 ]
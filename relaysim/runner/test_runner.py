@@ -2,16 +2,37 @@
 Test runner for executing YAML scenarios against device simulator.
 """
 
+import operator
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
+
+import orjson
 
 from ..simulator import DeviceSimulator, DeviceState
-from ..utils import get_logger
-from .yaml_loader import YAMLScenarioLoader
+from ..utils import get_logger, json_default
+from .yaml_loader import YAMLScenarioLoader, thaw_scenario_data
 
 logger = get_logger()
 
+# Assertion key -> (predicate(actual, expected), failure description)
+_ASSERT_OPS = {
+    "equals": (operator.eq, "expected {expected}"),
+    "not_equals": (operator.ne, "expected not {expected}"),
+    "greater_than": (operator.gt, "expected > {expected}"),
+    "less_than": (operator.lt, "expected < {expected}"),
+    "greater_or_equal": (operator.ge, "expected >= {expected}"),
+    "less_or_equal": (operator.le, "expected <= {expected}"),
+    "contains": (
+        lambda actual, substring: substring in str(actual),
+        "expected to contain '{expected}'",
+    ),
+    "in_range": (
+        lambda actual, spec: spec["min"] <= actual <= spec["max"],
+        "expected in range [{expected[min]}, {expected[max]}]",
+    ),
+}
+
 
 class TestStepError(Exception):
     """Raised when a test step fails."""
@@ -21,20 +42,23 @@ class TestStepError(Exception):
 class StepResult:
     """Result of a single test step."""
 
+    __slots__ = ("step_number", "step_type", "status", "message", "details", "duration_ms")
+
     def __init__(
         self,
         step_number: int,
         step_type: str,
         status: str,
         message: str = "",
-        details: Optional[Dict[str, Any]] = None,
+        details: Optional[Mapping[str, Any]] = None,
         duration_ms: float = 0.0,
     ):
         self.step_number = step_number
         self.step_type = step_type
         self.status = status  # "pass", "fail", "error"
         self.message = message
-        self.details = details or {}
+        # Steps from the loader are frozen; keep plain data for serialization
+        self.details = thaw_scenario_data(details) if details else {}
         self.duration_ms = duration_ms
 
     def to_dict(self) -> Dict[str, Any]:
@@ -52,6 +76,23 @@ class StepResult:
 class ScenarioResult:
     """Result of a complete scenario run."""
 
+    __slots__ = (
+        "scenario_name",
+        "description",
+        "run_id",
+        "start_time",
+        "start_datetime",
+        "end_time",
+        "end_datetime",
+        "step_results",
+        "overall_status",
+        "error_message",
+        "_passed",
+        "_failed",
+        "_cached_dict",
+        "_cached_json",
+    )
+
     def __init__(
         self,
         scenario_name: str,
@@ -62,25 +103,44 @@ class ScenarioResult:
         self.description = description
         self.run_id = run_id or self._generate_run_id()
         self.start_time = time.time()
+        self.start_datetime = datetime.fromtimestamp(self.start_time).isoformat()
         self.end_time: Optional[float] = None
+        self.end_datetime: Optional[str] = None
         self.step_results: List[StepResult] = []
+        self._passed = 0
+        self._failed = 0
         self.overall_status = "running"  # running, passed, failed, error
         self.error_message: Optional[str] = None
+        self._cached_dict: Optional[Dict[str, Any]] = None
+        self._cached_json: Optional[bytes] = None
 
     def _generate_run_id(self) -> str:
         """Generate a unique run ID."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{self.scenario_name}_{timestamp}"
+        return f"{self.scenario_name}_{time.time_ns()}"
 
     def add_step_result(self, result: StepResult) -> None:
         """Add a step result."""
         self.step_results.append(result)
+        if result.status == "pass":
+            self._passed += 1
+        elif result.status in ("fail", "error"):
+            self._failed += 1
+        self._cached_dict = None
+        self._cached_json = None
 
     def finalize(self, status: str, error_message: Optional[str] = None) -> None:
-        """Finalize the scenario result."""
+        """
+        Finalize the scenario result and cache its dictionary form.
+
+        JSON bytes are built on the first to_json_bytes() call, so
+        finalizing never depends on the step contents being serializable.
+        """
         self.end_time = time.time()
+        self.end_datetime = datetime.fromtimestamp(self.end_time).isoformat()
         self.overall_status = status
         self.error_message = error_message
+        self._cached_dict = self._build_dict()
+        self._cached_json = None
 
     @property
     def duration_seconds(self) -> float:
@@ -92,23 +152,47 @@ class ScenarioResult:
     @property
     def passed_steps(self) -> int:
         """Count of passed steps."""
-        return sum(1 for r in self.step_results if r.status == "pass")
+        return self._passed
 
     @property
     def failed_steps(self) -> int:
         """Count of failed steps."""
-        return sum(1 for r in self.step_results if r.status in ("fail", "error"))
+        return self._failed
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """
+        Convert to dictionary.
+
+        Finalized results reuse the dictionary built in finalize(); a shallow
+        copy is returned so callers can add top-level keys safely.
+        """
+        if self._cached_dict is None:
+            return self._build_dict()
+        return dict(self._cached_dict)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes, caching the payload once finalized."""
+        if self._cached_json is not None:
+            return self._cached_json
+        if self._cached_dict is None:
+            return orjson.dumps(
+                self._build_dict(), default=json_default, option=orjson.OPT_NON_STR_KEYS
+            )
+        self._cached_json = orjson.dumps(
+            self._cached_dict, default=json_default, option=orjson.OPT_NON_STR_KEYS
+        )
+        return self._cached_json
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary representation from scratch."""
         return {
             "run_id": self.run_id,
             "scenario_name": self.scenario_name,
             "description": self.description,
             "start_time": self.start_time,
-            "start_datetime": datetime.fromtimestamp(self.start_time).isoformat(),
+            "start_datetime": self.start_datetime,
             "end_time": self.end_time,
-            "end_datetime": datetime.fromtimestamp(self.end_time).isoformat() if self.end_time else None,
+            "end_datetime": self.end_datetime,
             "duration_seconds": round(self.duration_seconds, 3),
             "overall_status": self.overall_status,
             "error_message": self.error_message,
@@ -122,15 +206,26 @@ class ScenarioResult:
 class TestRunner:
     """Executes test scenarios against device simulator."""
 
-    def __init__(self, device: Optional[DeviceSimulator] = None):
+    def __init__(
+        self,
+        device: Optional[DeviceSimulator] = None,
+        loader: Optional[YAMLScenarioLoader] = None,
+    ):
         """
         Initialize the test runner.
 
         Args:
             device: Device simulator instance (creates new one if not provided)
+            loader: Scenario loader to share (creates new one if not provided)
         """
         self.device = device or DeviceSimulator()
-        self.loader = YAMLScenarioLoader()
+        self.loader = loader or YAMLScenarioLoader()
+        self._step_handlers = {
+            "write": self._execute_write,
+            "command": self._execute_command,
+            "wait": self._execute_wait,
+            "assert": self._execute_assert,
+        }
 
     def run_scenario(self, scenario_name: str) -> ScenarioResult:
         """
@@ -175,13 +270,13 @@ class TestRunner:
 
         return result
 
-    def _execute_step(self, step_number: int, step: Dict[str, Any]) -> StepResult:
+    def _execute_step(self, step_number: int, step: Mapping[str, Any]) -> StepResult:
         """
         Execute a single test step.
 
         Args:
             step_number: Step number (1-indexed)
-            step: Step dictionary from scenario
+            step: Step mapping from scenario
 
         Returns:
             StepResult
@@ -192,16 +287,10 @@ class TestRunner:
         logger.debug(f"Executing step {step_number}: {step_type}")
 
         try:
-            if step_type == "write":
-                self._execute_write(step)
-            elif step_type == "command":
-                self._execute_command(step)
-            elif step_type == "wait":
-                self._execute_wait(step)
-            elif step_type == "assert":
-                self._execute_assert(step)
-            else:
+            handler = self._step_handlers.get(step_type)
+            if handler is None:
                 raise TestStepError(f"Unknown step type: {step_type}")
+            handler(step)
 
             duration_ms = (time.time() - start_time) * 1000
             return StepResult(
@@ -235,7 +324,7 @@ class TestRunner:
                 duration_ms=duration_ms,
             )
 
-    def _execute_write(self, step: Dict[str, Any]) -> None:
+    def _execute_write(self, step: Mapping[str, Any]) -> None:
         """Execute a write step."""
         register = step["register"]
         value = step["value"]
@@ -247,7 +336,7 @@ class TestRunner:
         self.device.write_register(register, value)
         logger.debug(f"Wrote {value} to register '{register}'")
 
-    def _execute_command(self, step: Dict[str, Any]) -> None:
+    def _execute_command(self, step: Mapping[str, Any]) -> None:
         """Execute a command step."""
         action = step["action"]
 
@@ -263,13 +352,13 @@ class TestRunner:
 
         logger.debug(f"Executed command: {action}")
 
-    def _execute_wait(self, step: Dict[str, Any]) -> None:
+    def _execute_wait(self, step: Mapping[str, Any]) -> None:
         """Execute a wait step."""
         wait_ms = step["ms"]
         time.sleep(wait_ms / 1000.0)
         logger.debug(f"Waited {wait_ms}ms")
 
-    def _execute_assert(self, step: Dict[str, Any]) -> None:
+    def _execute_assert(self, step: Mapping[str, Any]) -> None:
         """Execute an assert step."""
         register = step["register"]
 
@@ -279,63 +368,18 @@ class TestRunner:
         else:
             actual_value = self.device.get_register(register)
 
-        # Check different assertion types
-        if "equals" in step:
-            expected = step["equals"]
-            if actual_value != expected:
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected {expected}"
-                )
-
-        elif "not_equals" in step:
-            expected = step["not_equals"]
-            if actual_value == expected:
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected not {expected}"
-                )
-
-        elif "greater_than" in step:
-            threshold = step["greater_than"]
-            if not (actual_value > threshold):
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected > {threshold}"
-                )
-
-        elif "less_than" in step:
-            threshold = step["less_than"]
-            if not (actual_value < threshold):
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected < {threshold}"
-                )
-
-        elif "greater_or_equal" in step:
-            threshold = step["greater_or_equal"]
-            if not (actual_value >= threshold):
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected >= {threshold}"
-                )
-
-        elif "less_or_equal" in step:
-            threshold = step["less_or_equal"]
-            if not (actual_value <= threshold):
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected <= {threshold}"
-                )
-
-        elif "contains" in step:
-            substring = step["contains"]
-            if substring not in str(actual_value):
-                raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected to contain '{substring}'"
-                )
-
-        elif "in_range" in step:
-            range_spec = step["in_range"]
-            min_val, max_val = range_spec["min"], range_spec["max"]
-            if not (min_val <= actual_value <= max_val):
+        # Evaluate the first assertion type present in the step
+        for key, expected in step.items():
+            assertion = _ASSERT_OPS.get(key)
+            if assertion is None:
+                continue
+            predicate, description = assertion
+            if not predicate(actual_value, expected):
                 raise AssertionError(
-                    f"Assertion failed: {register} = {actual_value}, expected in range [{min_val}, {max_val}]"
+                    f"Assertion failed: {register} = {actual_value}, "
+                    + description.format(expected=expected)
                 )
+            break
 
         logger.debug(f"Assertion passed for register '{register}'")
 
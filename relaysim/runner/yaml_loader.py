@@ -2,9 +2,12 @@
 YAML scenario loader for test scenarios.
 """
 
+import functools
+import itertools
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import yaml
 
@@ -12,6 +15,56 @@ from ..utils import get_logger
 
 logger = get_logger()
 
+# Resolved once at import: libyaml-backed loader when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Keys that make an assert step check something
+_ASSERTION_TYPES = frozenset({
+    "equals", "not_equals",
+    "greater_than", "less_than",
+    "greater_or_equal", "less_or_equal",
+    "contains", "in_range",
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_scenario_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a scenario file.
+
+    Results are cached per path, modification time and size, so an edited
+    file is parsed again on its next load. The cached data is shared and
+    must not be handed out without copying.
+    """
+    # Hand the raw bytes to the loader; libyaml decodes UTF-8 itself
+    return yaml.load(Path(path).read_bytes(), Loader=_YAML_LOADER)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert parsed YAML into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw_scenario_data(value: Any) -> Any:
+    """
+    Convert frozen scenario data back into plain dicts and lists.
+
+    Args:
+        value: Scenario, step or value returned by YAMLScenarioLoader
+
+    Returns:
+        Mutable copy built from dicts and lists
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw_scenario_data(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_scenario_data(v) for v in value]
+    return value
+
 
 class ScenarioLoadError(Exception):
     """Raised when a scenario file cannot be loaded."""
@@ -23,17 +76,59 @@ class ScenarioValidationError(Exception):
     pass
 
 
+# Required fields per step type
+_WRITE_FIELDS = frozenset({"register", "value"})
+_COMMAND_FIELDS = frozenset({"action"})
+_WAIT_FIELDS = frozenset({"ms"})
+_ASSERT_FIELDS = frozenset({"register"})  # Plus one of _ASSERTION_TYPES
+
+
+def _require_fields(index: int, step: Mapping[str, Any], fields: frozenset) -> None:
+    """Raise if a step lacks any of the given fields."""
+    if not step.keys() >= fields:
+        missing = sorted(fields - step.keys())
+        raise ScenarioValidationError(
+            f"Step {index} (type '{step['step']}') missing required field '{missing[0]}'"
+        )
+
+
+def _validate_write(index: int, step: Mapping[str, Any]) -> None:
+    _require_fields(index, step, _WRITE_FIELDS)
+
+
+def _validate_command(index: int, step: Mapping[str, Any]) -> None:
+    _require_fields(index, step, _COMMAND_FIELDS)
+
+
+def _validate_wait(index: int, step: Mapping[str, Any]) -> None:
+    _require_fields(index, step, _WAIT_FIELDS)
+
+
+def _validate_assert(index: int, step: Mapping[str, Any]) -> None:
+    _require_fields(index, step, _ASSERT_FIELDS)
+    if _ASSERTION_TYPES.isdisjoint(step):
+        raise ScenarioValidationError(
+            f"Step {index} (assert) must have at least one assertion type: "
+            f"{sorted(_ASSERTION_TYPES)}"
+        )
+
+
+# Step type -> validator(index, step)
+_STEP_VALIDATORS = {
+    "write": _validate_write,
+    "command": _validate_command,
+    "wait": _validate_wait,
+    "assert": _validate_assert,
+}
+
+
 class YAMLScenarioLoader:
     """Loads and validates YAML test scenarios."""
 
-    VALID_STEP_TYPES = {"write", "command", "wait", "assert"}
+    VALID_STEP_TYPES = frozenset(_STEP_VALIDATORS)
 
-    REQUIRED_FIELDS = {
-        "write": ["register", "value"],
-        "command": ["action"],
-        "wait": ["ms"],
-        "assert": ["register"],  # Also needs one of: equals, greater_than, less_than, etc.
-    }
+    # Maximum lines scanned for the name/description header before "steps:"
+    HEADER_MAX_LINES = 20
 
     def __init__(self, scenarios_dir: Optional[str] = None):
         """
@@ -49,15 +144,21 @@ class YAMLScenarioLoader:
 
         self.scenarios_dir = Path(scenarios_dir)
 
-    def load_scenario(self, scenario_name: str) -> Dict[str, Any]:
+        # Validated scenarios: path -> ((mtime_ns, size), frozen scenario)
+        self._cache: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
+
+    def load_scenario(self, scenario_name: str) -> Mapping[str, Any]:
         """
         Load a single scenario by name.
 
+        The scenario is read-only: mappings are MappingProxyType views and
+        lists are tuples, so one cached copy is shared by all callers.
+
         Args:
             scenario_name: Name of the scenario (without .yaml extension)
 
         Returns:
-            Dictionary with scenario metadata and steps
+            Read-only mapping with scenario metadata and steps
 
         Raises:
             ScenarioLoadError: If file cannot be loaded
@@ -69,14 +170,21 @@ class YAMLScenarioLoader:
 
         scenario_path = self.scenarios_dir / scenario_name
 
-        if not scenario_path.exists():
+        try:
+            st = scenario_path.stat()
+        except FileNotFoundError:
             raise ScenarioLoadError(f"Scenario file not found: {scenario_path}")
 
+        path = str(scenario_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         logger.debug(f"Loading scenario from {scenario_path}")
 
         try:
-            with open(scenario_path, "r") as f:
-                data = yaml.safe_load(f)
+            data = _parse_scenario_file(path, *stamp)
         except yaml.YAMLError as e:
             raise ScenarioLoadError(f"Failed to parse YAML: {e}")
         except Exception as e:
@@ -105,55 +213,39 @@ class YAMLScenarioLoader:
 
         logger.info(f"Loaded scenario '{scenario['name']}' with {len(scenario['steps'])} steps")
 
-        return scenario
+        frozen = _freeze(scenario)
+        self._cache[path] = (stamp, frozen)
+        return frozen
 
-    def _validate_steps(self, steps: List[Dict[str, Any]]) -> None:
+    def _validate_steps(self, steps: Sequence[Mapping[str, Any]]) -> None:
         """
         Validate scenario steps.
 
         Args:
-            steps: List of step dictionaries
+            steps: Sequence of step mappings
 
         Raises:
             ScenarioValidationError: If any step is invalid
         """
-        if not isinstance(steps, list):
+        if not isinstance(steps, (list, tuple)):
             raise ScenarioValidationError("Steps must be a list")
 
+        validators = _STEP_VALIDATORS
+
         for i, step in enumerate(steps):
-            if not isinstance(step, dict):
+            if not isinstance(step, Mapping):
                 raise ScenarioValidationError(f"Step {i} must be a dictionary")
 
-            if "step" not in step:
-                raise ScenarioValidationError(f"Step {i} missing 'step' field")
-
-            step_type = step["step"]
-            if step_type not in self.VALID_STEP_TYPES:
+            validator = validators.get(step.get("step"))
+            if validator is None:
+                if "step" not in step:
+                    raise ScenarioValidationError(f"Step {i} missing 'step' field")
                 raise ScenarioValidationError(
-                    f"Step {i} has invalid type '{step_type}'. "
-                    f"Valid types: {self.VALID_STEP_TYPES}"
+                    f"Step {i} has invalid type '{step['step']}'. "
+                    f"Valid types: {sorted(self.VALID_STEP_TYPES)}"
                 )
 
-            # Check required fields
-            required = self.REQUIRED_FIELDS.get(step_type, [])
-            for field in required:
-                if field not in step:
-                    raise ScenarioValidationError(
-                        f"Step {i} (type '{step_type}') missing required field '{field}'"
-                    )
-
-            # Special validation for assert steps
-            if step_type == "assert":
-                assertion_types = [
-                    "equals", "not_equals",
-                    "greater_than", "less_than",
-                    "greater_or_equal", "less_or_equal",
-                    "contains", "in_range"
-                ]
-                if not any(at in step for at in assertion_types):
-                    raise ScenarioValidationError(
-                        f"Step {i} (assert) must have at least one assertion type: {assertion_types}"
-                    )
+            validator(i, step)
 
     def list_scenarios(self) -> List[Dict[str, str]]:
         """
@@ -166,20 +258,62 @@ class YAMLScenarioLoader:
             logger.warning(f"Scenarios directory does not exist: {self.scenarios_dir}")
             return []
 
+        # scandir reports file type from the directory entry, without the
+        # per-entry Path objects and stats of Path.glob
+        with os.scandir(self.scenarios_dir) as it:
+            entries = [e for e in it if e.name.endswith(".yaml") and e.is_file()]
+
         scenarios = []
-        for yaml_file in self.scenarios_dir.glob("*.yaml"):
+        for entry in entries:
             try:
-                scenario = self.load_scenario(yaml_file.name)
+                header = self._load_header(entry.path)
                 scenarios.append({
-                    "name": scenario["name"],
-                    "description": scenario["description"],
-                    "filename": yaml_file.name,
+                    "name": header["name"],
+                    "description": header["description"],
+                    "filename": entry.name,
                 })
             except Exception as e:
-                logger.error(f"Failed to load scenario {yaml_file.name}: {e}")
+                logger.error(f"Failed to load scenario {entry.name}: {e}")
 
         return scenarios
 
+    def _load_header(self, scenario_path: str) -> Dict[str, str]:
+        """
+        Read a scenario's name and description without parsing its steps.
+
+        Only the lines before the top-level "steps:" key are parsed, and
+        only when they hold both name and description. Other files (legacy
+        step lists, or any metadata placed after the steps) fall back to a
+        full load.
+
+        Args:
+            scenario_path: Path to scenario file
+
+        Returns:
+            Dictionary with scenario name and description
+        """
+        header_lines = []
+        complete = False
+        with open(scenario_path, "r") as f:
+            for line in itertools.islice(f, self.HEADER_MAX_LINES):
+                if line.startswith("steps:"):
+                    complete = True
+                    break
+                header_lines.append(line)
+
+        header = None
+        if complete:
+            try:
+                header = yaml.load("".join(header_lines), Loader=_YAML_LOADER)
+            except yaml.YAMLError:
+                header = None
+
+        if not isinstance(header, dict) or not header.keys() >= {"name", "description"}:
+            scenario = self.load_scenario(os.path.basename(scenario_path))
+            return {"name": scenario["name"], "description": scenario["description"]}
+
+        return {"name": header["name"], "description": header["description"]}
+
     def validate_scenario_file(self, scenario_path: str) -> bool:
         """
         Validate a scenario file without fully loading it.
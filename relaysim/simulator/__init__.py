@@ -1,5 +1,6 @@
 """Device simulator package."""
 
+from .clock import RealClock, VirtualClock
 from .device import DeviceSimulator
 from .state_machine import DeviceState, InvalidStateTransitionError, StateMachine
 
@@ -8,4 +9,6 @@ __all__ = [
     "DeviceState",
     "StateMachine",
     "InvalidStateTransitionError",
+    "RealClock",
+    "VirtualClock",
 ]
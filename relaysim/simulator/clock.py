@@ -0,0 +1,54 @@
+"""
+Time sources for the device simulator.
+
+The simulator waits to model activation, reset and fault-detection delays.
+A virtual clock lets tests run those delays without blocking.
+"""
+
+import time
+from typing import Optional, Protocol
+
+
+class Clock(Protocol):
+    """Interface for simulator time sources."""
+
+    def now(self) -> float:
+        """Get the current time in seconds since the epoch."""
+        ...
+
+    def sleep(self, seconds: float) -> None:
+        """Wait for the given number of seconds."""
+        ...
+
+
+class RealClock:
+    """Wall-clock time source backed by the time module."""
+
+    def now(self) -> float:
+        """Get the current time in seconds since the epoch."""
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        """Block for the given number of seconds."""
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """Simulated time source that advances instantly when sleeping."""
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Initialize the virtual clock.
+
+        Args:
+            start: Initial time in seconds (defaults to the current wall time)
+        """
+        self._now = time.time() if start is None else start
+
+    def now(self) -> float:
+        """Get the current virtual time."""
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance virtual time without blocking."""
+        self._now += seconds
@@ -4,10 +4,13 @@ Device simulator for safety-critical relay/protection device.
 Simulates firmware-controlled device with registers, states, and timing.
 """
 
-import time
-from typing import Any, Dict, List, Optional
+import itertools
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 
+from .clock import Clock, RealClock
 from .state_machine import DeviceState, StateMachine, InvalidStateTransitionError
 
 
@@ -29,17 +32,24 @@ class CommandExecutionError(DeviceSimulationError):
 class LogEntry:
     """Represents a single log entry."""
 
+    __slots__ = ("timestamp", "level", "message", "data")
+
     def __init__(self, timestamp: float, level: str, message: str, data: Optional[Dict] = None):
         self.timestamp = timestamp
         self.level = level
         self.message = message
         self.data = data or {}
 
+    @property
+    def iso_timestamp(self) -> str:
+        """ISO 8601 timestamp, formatted on demand."""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "timestamp": self.timestamp,
-            "datetime": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "datetime": self.iso_timestamp,
             "level": self.level,
             "message": self.message,
             "data": self.data,
@@ -63,11 +73,24 @@ class DeviceSimulator:
     - Comprehensive logging
     """
 
+    __slots__ = (
+        "_clock",
+        "_state_machine",
+        "_registers",
+        "_registers_view",
+        "_logs",
+        "_activation_start_time",
+        "_fault_type",
+    )
+
     # Timing constants (in seconds)
     ACTIVATION_DELAY = 0.15  # Time from activate command to ACTIVE state
     RESET_DELAY = 0.1  # Time for reset operation
     FAULT_DETECTION_DELAY = 0.05  # Time to detect and transition to FAULT
 
+    # Maximum number of log entries retained (oldest are dropped first)
+    MAX_LOGS = 10000
+
     # Default register values
     DEFAULT_REGISTERS = {
         "voltage": 0.0,
@@ -79,11 +102,23 @@ class DeviceSimulator:
         "status_word": 0x0000,
     }
 
-    def __init__(self):
-        """Initialize the device simulator."""
+    # Register name -> expected value type, derived from the defaults
+    _REGISTER_TYPES = {name: type(value) for name, value in DEFAULT_REGISTERS.items()}
+
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Initialize the device simulator.
+
+        Args:
+            clock: Time source for timestamps and simulated delays
+                (defaults to wall-clock time)
+        """
+        self._clock = clock or RealClock()
         self._state_machine = StateMachine(DeviceState.IDLE)
         self._registers: Dict[str, Any] = self.DEFAULT_REGISTERS.copy()
-        self._logs: List[LogEntry] = []
+        self._registers_view: Mapping[str, Any] = MappingProxyType(self._registers)
+        # Log records kept as (timestamp, level, message, data) tuples
+        self._logs: Deque[Tuple[float, str, str, Optional[Dict]]] = deque(maxlen=self.MAX_LOGS)
         self._activation_start_time: Optional[float] = None
         self._fault_type: Optional[str] = None
 
@@ -95,19 +130,51 @@ class DeviceSimulator:
         return self._state_machine.current_state
 
     @property
-    def registers(self) -> Dict[str, Any]:
-        """Get a copy of all registers."""
-        return self._registers.copy()
+    def registers(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of all registers.
+
+        The view reflects later writes; use dict(device.registers) for a
+        snapshot.
+        """
+        return self._registers_view
 
     @property
     def logs(self) -> List[LogEntry]:
-        """Get all log entries."""
-        return self._logs.copy()
+        """Get all retained log entries, oldest first."""
+        return [LogEntry(*record) for record in self._logs]
+
+    @property
+    def log_count(self) -> int:
+        """Get the number of log entries without copying them."""
+        return len(self._logs)
+
+    def logs_since(self, index: int) -> Tuple[LogEntry, ...]:
+        """
+        Get log entries from a position onward, oldest first.
+
+        Pair with a ``log_count`` snapshot taken before an operation to get
+        only the entries it added, without copying the whole log. The tail
+        is read from the newest end and returned as a stable tuple, so the
+        device can keep logging while the caller uses it. Positions shift
+        once the log is full and old entries are dropped.
+
+        Args:
+            index: Position of the first entry to return
+
+        Returns:
+            Tuple of log entries
+        """
+        count = len(self._logs) - index
+        if count <= 0:
+            return ()
+        tail = list(itertools.islice(reversed(self._logs), count))
+        tail.reverse()
+        return tuple(LogEntry(*record) for record in tail)
 
     def _log(self, level: str, message: str, data: Optional[Dict] = None) -> None:
         """Add a log entry."""
-        entry = LogEntry(time.time(), level, message, data)
-        self._logs.append(entry)
+        self._logs.append((self._clock.now(), level, message, data))
 
     def get_register(self, name: str) -> Any:
         """
@@ -126,24 +193,29 @@ class DeviceSimulator:
             raise RegisterWriteError(f"Register '{name}' does not exist")
         return self._registers[name]
 
-    def write_register(self, name: str, value: Any) -> None:
+    def _coerce_register_value(self, name: str, value: Any) -> Any:
         """
-        Write a value to a register.
+        Validate a register write and convert the value to the register's type.
 
         Args:
             name: Register name
             value: Value to write
 
+        Returns:
+            Value converted to the register's type
+
         Raises:
             RegisterWriteError: If register doesn't exist or value is invalid
         """
-        if name not in self._registers:
+        expected_type = self._REGISTER_TYPES.get(name)
+        if expected_type is None:
             raise RegisterWriteError(f"Register '{name}' does not exist")
 
-        old_value = self._registers[name]
+        # Common case: value already has the register's exact type
+        if value.__class__ is expected_type:
+            return value
 
         # Type validation based on default register types
-        expected_type = type(self.DEFAULT_REGISTERS[name])
         if not isinstance(value, expected_type):
             try:
                 value = expected_type(value)
@@ -153,6 +225,22 @@ class DeviceSimulator:
                     f"Expected {expected_type.__name__}, got {type(value).__name__}"
                 )
 
+        return value
+
+    def write_register(self, name: str, value: Any) -> None:
+        """
+        Write a value to a register.
+
+        Args:
+            name: Register name
+            value: Value to write
+
+        Raises:
+            RegisterWriteError: If register doesn't exist or value is invalid
+        """
+        value = self._coerce_register_value(name, value)
+
+        old_value = self._registers[name]
         self._registers[name] = value
         self._log(
             "DEBUG",
@@ -160,6 +248,46 @@ class DeviceSimulator:
             {"old_value": old_value, "new_value": value}
         )
 
+    def write_many(self, values: Dict[str, Any]) -> None:
+        """
+        Write several registers with a single log entry.
+
+        All values are validated before any register is written, so a
+        failed write leaves every register unchanged.
+
+        Args:
+            values: Mapping of register name to value
+
+        Raises:
+            RegisterWriteError: If a register doesn't exist or a value is invalid
+        """
+        coerced = {name: self._coerce_register_value(name, value) for name, value in values.items()}
+        if not coerced:
+            return
+
+        old_values = {name: self._registers[name] for name in coerced}
+        self._registers.update(coerced)
+        self._log(
+            "DEBUG",
+            f"Register bulk write: {', '.join(coerced)}",
+            {"old_values": old_values, "new_values": coerced}
+        )
+
+    def _set_status_bits(self, set_mask: int = 0, clear_mask: int = 0) -> None:
+        """
+        Set and clear status word bits in a single masked write.
+
+        The register is only written when the resulting value changes.
+
+        Args:
+            set_mask: Bits to set
+            clear_mask: Bits to clear (applied before set_mask)
+        """
+        status_word = self._registers["status_word"]
+        new_status_word = (status_word & ~clear_mask) | set_mask
+        if new_status_word != status_word:
+            self._registers["status_word"] = new_status_word
+
     def activate(self) -> None:
         """
         Activate the device.
@@ -169,7 +297,9 @@ class DeviceSimulator:
         Raises:
             CommandExecutionError: If activation fails
         """
-        if self.state != DeviceState.IDLE:
+        # Reject before the delay so a failed activation returns immediately;
+        # from IDLE the state machine transition below cannot fail
+        if self.state is not DeviceState.IDLE:
             raise CommandExecutionError(
                 f"Cannot activate from state {self.state.value}. Must be in IDLE state."
             )
@@ -177,25 +307,23 @@ class DeviceSimulator:
         self._log("INFO", "Activation command received", {"current_state": self.state.value})
 
         # Start activation process
-        self._activation_start_time = time.time()
+        start_time = self._clock.now()
 
         # Simulate the activation delay
-        time.sleep(self.ACTIVATION_DELAY)
+        self._clock.sleep(self.ACTIVATION_DELAY)
 
         # Perform state transition
-        try:
-            old_state = self.state
-            self._state_machine.activate()
-            self._log(
-                "INFO",
-                "Device activated",
-                {"previous_state": old_state.value, "new_state": self.state.value}
-            )
-            # Update status word
-            self._registers["status_word"] |= 0x0001  # Set bit 0 for ACTIVE
-        except InvalidStateTransitionError as e:
-            self._log("ERROR", f"Activation failed: {e}")
-            raise CommandExecutionError(str(e))
+        old_state = self.state
+        self._state_machine.activate()
+
+        self._activation_start_time = start_time
+        self._log(
+            "INFO",
+            "Device activated",
+            {"previous_state": old_state.value, "new_state": self.state.value}
+        )
+        # Update status word
+        self._set_status_bits(set_mask=0x0001)  # Set bit 0 for ACTIVE
 
     def reset(self) -> None:
         """
@@ -209,7 +337,7 @@ class DeviceSimulator:
         self._log("INFO", "Reset command received", {"current_state": self.state.value})
 
         # Simulate reset delay
-        time.sleep(self.RESET_DELAY)
+        self._clock.sleep(self.RESET_DELAY)
 
         try:
             old_state = self.state
@@ -219,7 +347,7 @@ class DeviceSimulator:
             self._fault_type = None
             self._activation_start_time = None
             self._registers["trip_flag"] = False
-            self._registers["status_word"] &= 0xFFFE  # Clear bit 0
+            self._set_status_bits(clear_mask=0x0001)  # Clear bit 0
 
             self._log(
                 "INFO",
@@ -228,7 +356,7 @@ class DeviceSimulator:
             )
         except InvalidStateTransitionError as e:
             self._log("ERROR", f"Reset failed: {e}")
-            raise CommandExecutionError(str(e))
+            raise CommandExecutionError(str(e)) from e
 
     def inject_fault(self, fault_type: str = "overcurrent") -> None:
         """
@@ -247,7 +375,7 @@ class DeviceSimulator:
         )
 
         # Simulate fault detection delay
-        time.sleep(self.FAULT_DETECTION_DELAY)
+        self._clock.sleep(self.FAULT_DETECTION_DELAY)
 
         try:
             old_state = self.state
@@ -257,7 +385,7 @@ class DeviceSimulator:
             # Update registers based on fault type
             self._registers["trip_flag"] = True
             self._registers["trip_count"] += 1
-            self._registers["status_word"] |= 0x0080  # Set bit 7 for FAULT
+            self._set_status_bits(set_mask=0x0080)  # Set bit 7 for FAULT
 
             if fault_type == "overcurrent":
                 self._registers["current"] = 999.9  # Abnormally high
@@ -277,7 +405,7 @@ class DeviceSimulator:
             )
         except InvalidStateTransitionError as e:
             self._log("ERROR", f"Fault injection failed: {e}")
-            raise CommandExecutionError(str(e))
+            raise CommandExecutionError(str(e)) from e
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -288,10 +416,10 @@ class DeviceSimulator:
         """
         return {
             "state": self.state.value,
-            "registers": self.registers,
+            "registers": dict(self._registers),
             "fault_active": self._state_machine.fault_active,
             "fault_type": self._fault_type,
-            "log_count": len(self._logs),
+            "log_count": self.log_count,
         }
 
     def clear_logs(self) -> None:
@@ -9,10 +9,21 @@ from typing import Optional
 
 
 class DeviceState(Enum):
-    """Valid states for the device."""
-    IDLE = "IDLE"
-    ACTIVE = "ACTIVE"
-    FAULT = "FAULT"
+    """
+    Valid states for the device.
+
+    Values are the names used in scenarios and the API; ``index`` is a
+    dense integer used to index the transition table.
+    """
+    IDLE = ("IDLE", 0)
+    ACTIVE = ("ACTIVE", 1)
+    FAULT = ("FAULT", 2)
+
+    def __new__(cls, value: str, index: int):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = index
+        return member
 
 
 class InvalidStateTransitionError(Exception):
@@ -20,6 +31,17 @@ class InvalidStateTransitionError(Exception):
     pass
 
 
+# Transition conditions, in transition table column order
+_CONDITIONS = (
+    "activation_requested",
+    "reset_requested",
+    "fault_injected",
+    "reset_after_fault",
+)
+_CONDITION_IDS = {condition: i for i, condition in enumerate(_CONDITIONS)}
+_ACTIVATION_REQUESTED, _RESET_REQUESTED, _FAULT_INJECTED, _RESET_AFTER_FAULT = range(len(_CONDITIONS))
+
+
 class StateMachine:
     """
     Manages device state transitions with strict validation rules.
@@ -29,16 +51,19 @@ class StateMachine:
     - ACTIVE -> IDLE (via reset command)
     - Any state -> FAULT (via fault injection)
     - FAULT -> IDLE (via reset command, only after fault is cleared)
+    - IDLE -> IDLE and FAULT -> FAULT are accepted no-ops for reset and
+      fault injection respectively
     """
 
-    # Valid transitions: (from_state, to_state) -> required_condition
-    VALID_TRANSITIONS = {
-        (DeviceState.IDLE, DeviceState.ACTIVE): "activation_requested",
-        (DeviceState.ACTIVE, DeviceState.IDLE): "reset_requested",
-        (DeviceState.IDLE, DeviceState.FAULT): "fault_injected",
-        (DeviceState.ACTIVE, DeviceState.FAULT): "fault_injected",
-        (DeviceState.FAULT, DeviceState.IDLE): "reset_after_fault",
-    }
+    __slots__ = ("_current_state", "_fault_active")
+
+    # Transition table: [from_state.index][condition id] -> to_state (None if invalid)
+    _TRANSITION_TABLE = (
+        # activation_requested, reset_requested, fault_injected, reset_after_fault
+        (DeviceState.ACTIVE, DeviceState.IDLE, DeviceState.FAULT, None),  # IDLE
+        (None, DeviceState.IDLE, DeviceState.FAULT, None),  # ACTIVE
+        (None, None, DeviceState.FAULT, DeviceState.IDLE),  # FAULT
+    )
 
     def __init__(self, initial_state: DeviceState = DeviceState.IDLE):
         """Initialize the state machine."""
@@ -66,18 +91,10 @@ class StateMachine:
         Returns:
             True if transition is valid, False otherwise
         """
-        if self._current_state == new_state:
-            return True  # Already in target state
-
-        transition = (self._current_state, new_state)
-        if transition not in self.VALID_TRANSITIONS:
+        condition_id = _CONDITION_IDS.get(condition)
+        if condition_id is None:
             return False
-
-        required_condition = self.VALID_TRANSITIONS[transition]
-        if condition is None:
-            return False
-
-        return condition == required_condition
+        return self._TRANSITION_TABLE[self._current_state.index][condition_id] is new_state
 
     def transition(self, new_state: DeviceState, condition: str) -> DeviceState:
         """
@@ -93,37 +110,43 @@ class StateMachine:
         Raises:
             InvalidStateTransitionError: If transition is not valid
         """
-        if self._current_state == new_state:
-            return self._current_state  # Already in target state
-
-        if not self.can_transition(new_state, condition):
+        condition_id = _CONDITION_IDS.get(condition)
+        if condition_id is None:
             raise InvalidStateTransitionError(
                 f"Cannot transition from {self._current_state.value} to {new_state.value} "
                 f"with condition '{condition}'"
             )
+        return self._apply(new_state, condition_id)
+
+    def _apply(self, new_state: DeviceState, condition_id: int) -> DeviceState:
+        """Apply a transition identified by its condition table column."""
+        if self._TRANSITION_TABLE[self._current_state.index][condition_id] is not new_state:
+            raise InvalidStateTransitionError(
+                f"Cannot transition from {self._current_state.value} to {new_state.value} "
+                f"with condition '{_CONDITIONS[condition_id]}'"
+            )
 
-        old_state = self._current_state
         self._current_state = new_state
 
-        # Update fault status
-        if condition == "fault_injected":
+        # Update fault status; reset_after_fault only exists from FAULT
+        if condition_id == _FAULT_INJECTED:
             self._fault_active = True
-        elif condition == "reset_after_fault" and old_state == DeviceState.FAULT:
+        elif condition_id == _RESET_AFTER_FAULT:
             self._fault_active = False
 
-        return self._current_state
+        return new_state
 
     def activate(self) -> DeviceState:
         """Activate the device (IDLE -> ACTIVE)."""
-        return self.transition(DeviceState.ACTIVE, "activation_requested")
+        return self._apply(DeviceState.ACTIVE, _ACTIVATION_REQUESTED)
 
     def reset(self) -> DeviceState:
         """Reset the device to IDLE state."""
-        if self._current_state == DeviceState.FAULT:
-            return self.transition(DeviceState.IDLE, "reset_after_fault")
+        if self._current_state is DeviceState.FAULT:
+            return self._apply(DeviceState.IDLE, _RESET_AFTER_FAULT)
         else:
-            return self.transition(DeviceState.IDLE, "reset_requested")
+            return self._apply(DeviceState.IDLE, _RESET_REQUESTED)
 
     def inject_fault(self) -> DeviceState:
         """Inject a fault (any state -> FAULT)."""
-        return self.transition(DeviceState.FAULT, "fault_injected")
+        return self._apply(DeviceState.FAULT, _FAULT_INJECTED)
@@ -2,31 +2,74 @@
 Pytest fixtures for Relaysim tests.
 """
 
+import os
+
+# Console log output is only captured and discarded during the suite; set
+# before relaysim is imported so the global logger picks it up
+os.environ.setdefault("RELAYSIM_QUIET_CONSOLE", "1")
+
 import pytest
 from pathlib import Path
 
-from simulator import DeviceSimulator
+from simulator import DeviceSimulator, VirtualClock
 from runner import YAMLScenarioLoader, TestRunner
 
 
 @pytest.fixture
 def device():
-    """Create a fresh device simulator for each test."""
-    return DeviceSimulator()
+    """Create a fresh device simulator for each test.
 
+    Uses a virtual clock so simulated device delays do not block.
+    """
+    return DeviceSimulator(clock=VirtualClock())
 
-@pytest.fixture
-def runner(device):
-    """Create a test runner with a fresh device."""
-    return TestRunner(device)
+
+@pytest.fixture(scope="session")
+def readonly_device():
+    """Create one device simulator shared by tests that only inspect it.
+
+    Tests that write registers or run commands must use ``device``.
+    """
+    return DeviceSimulator(clock=VirtualClock())
+
+
+@pytest.fixture(scope="session")
+def device_factory():
+    """Build fresh virtual-clock device simulators on demand."""
+    return lambda: DeviceSimulator(clock=VirtualClock())
 
 
 @pytest.fixture
+def runner(device, scenario_loader):
+    """Create a test runner with a fresh device and the shared loader."""
+    return TestRunner(device, loader=scenario_loader)
+
+
+@pytest.fixture(scope="session")
 def scenario_loader():
-    """Create a YAML scenario loader."""
+    """Create a YAML scenario loader shared across the session.
+
+    The loader caches each validated scenario and returns the same
+    read-only object on every load, so sharing it keeps parse results for
+    the whole run and tests cannot mutate what other tests see.
+    """
     return YAMLScenarioLoader()
 
 
+@pytest.fixture(scope="session")
+def runner_factory(scenario_loader, device_factory):
+    """Build test runners with a fresh device and the shared loader."""
+    def make_runner():
+        return TestRunner(device_factory(), loader=scenario_loader)
+    return make_runner
+
+
+@pytest.fixture(scope="session")
+def activate_result(runner_factory):
+    """Run the activate scenario once and share its read-only result."""
+    return runner_factory().run_scenario("activate")
+
+
 @pytest.fixture
 def scenarios_dir():
     """Get the path to the example scenarios directory."""
@@ -9,20 +9,37 @@ from simulator import (
     DeviceState,
     InvalidStateTransitionError,
     RegisterWriteError,
+    StateMachine,
     CommandExecutionError,
+    VirtualClock,
 )
 
 
+# (fault_type, register, predicate on the register value after injection)
+FAULT_CASES = [
+    ("overcurrent", "current", lambda v: v > 100.0),
+    ("overvoltage", "voltage", lambda v: v > 400.0),
+    ("temperature", "temperature", lambda v: v >= 90.0),
+]
+
+# (expected state, setup applied to the device, fault_active, fault_type)
+STATUS_CASES = [
+    ("IDLE", lambda d: None, False, None),
+    ("ACTIVE", lambda d: d.activate(), False, None),
+    ("FAULT", lambda d: d.inject_fault("overcurrent"), True, "overcurrent"),
+]
+
+
 class TestDeviceSimulatorInitialization:
     """Tests for device initialization."""
 
-    def test_initial_state_is_idle(self, device):
+    def test_initial_state_is_idle(self, readonly_device):
         """Device should start in IDLE state."""
-        assert device.state == DeviceState.IDLE
+        assert readonly_device.state == DeviceState.IDLE
 
-    def test_default_registers_initialized(self, device):
+    def test_default_registers_initialized(self, readonly_device):
         """All default registers should be initialized."""
-        registers = device.registers
+        registers = readonly_device.registers
         assert "voltage" in registers
         assert "current" in registers
         assert "frequency" in registers
@@ -31,36 +48,57 @@ class TestDeviceSimulatorInitialization:
         assert "temperature" in registers
         assert "status_word" in registers
 
-    def test_default_register_values(self, device):
-        """Default register values should be correct."""
-        assert device.get_register("voltage") == 0.0
-        assert device.get_register("current") == 0.0
-        assert device.get_register("frequency") == 60.0
-        assert device.get_register("trip_flag") is False
-        assert device.get_register("trip_count") == 0
-        assert device.get_register("temperature") == 25.0
-        assert device.get_register("status_word") == 0x0000
+    def test_registers_view_is_read_only(self, device):
+        """Registers property should not allow writes that bypass validation."""
+        with pytest.raises(TypeError):
+            device.registers["voltage"] = 120.0
 
-    def test_logs_created_on_initialization(self, device):
+    def test_default_register_values(self, readonly_device):
+        """Default register values should be correct."""
+        assert readonly_device.get_register("voltage") == 0.0
+        assert readonly_device.get_register("current") == 0.0
+        assert readonly_device.get_register("frequency") == 60.0
+        assert readonly_device.get_register("trip_flag") is False
+        assert readonly_device.get_register("trip_count") == 0
+        assert readonly_device.get_register("temperature") == 25.0
+        assert readonly_device.get_register("status_word") == 0x0000
+
+    def test_logs_created_on_initialization(self, readonly_device):
         """Device should create initialization log."""
-        logs = device.logs
+        logs = readonly_device.logs
         assert len(logs) > 0
         assert logs[0].level == "INFO"
         assert "initialized" in logs[0].message.lower()
 
 
+class TestSimulatedTiming:
+    """Tests for the device clock."""
+
+    def test_virtual_clock_advances_on_delays(self):
+        """Command delays should advance a virtual clock instead of blocking."""
+        clock = VirtualClock(start=1000.0)
+        device = DeviceSimulator(clock=clock)
+
+        device.activate()
+        device.reset()
+
+        expected = DeviceSimulator.ACTIVATION_DELAY + DeviceSimulator.RESET_DELAY
+        assert clock.now() == pytest.approx(1000.0 + expected)
+        assert device.logs[-1].timestamp == clock.now()
+
+
 class TestRegisterOperations:
     """Tests for register read/write operations."""
 
-    def test_read_existing_register(self, device):
+    def test_read_existing_register(self, readonly_device):
         """Should successfully read an existing register."""
-        value = device.get_register("voltage")
+        value = readonly_device.get_register("voltage")
         assert value == 0.0
 
-    def test_read_nonexistent_register(self, device):
+    def test_read_nonexistent_register(self, readonly_device):
         """Should raise error when reading non-existent register."""
         with pytest.raises(RegisterWriteError):
-            device.get_register("nonexistent")
+            readonly_device.get_register("nonexistent")
 
     def test_write_valid_value(self, device):
         """Should successfully write valid value to register."""
@@ -93,11 +131,43 @@ class TestRegisterOperations:
         device.write_register("trip_count", 5)
         assert device.get_register("trip_count") == 5
 
+    def test_write_many(self, device):
+        """Bulk writes should update every register with one log entry."""
+        initial_log_count = device.log_count
+        device.write_many({"voltage": "120.5", "trip_count": 3})
+        assert device.get_register("voltage") == 120.5
+        assert device.get_register("trip_count") == 3
+        assert device.log_count == initial_log_count + 1
+
+    def test_write_many_invalid_value_writes_nothing(self, device):
+        """A bulk write with an invalid value should leave all registers unchanged."""
+        with pytest.raises(RegisterWriteError):
+            device.write_many({"voltage": 120.0, "current": "not_a_number"})
+        assert device.get_register("voltage") == 0.0
+
+    def test_logs_since_is_stable_snapshot(self, device):
+        """logs_since should return only newer entries, unaffected by later logging."""
+        initial_log_count = device.log_count
+        device.write_register("voltage", 120.0)
+        logs = device.logs_since(initial_log_count)
+        device.write_register("current", 5.0)
+
+        assert [log.message for log in logs] == ["Register write: voltage"]
+        assert device.logs_since(device.log_count) == ()
+
+    def test_logs_bounded_by_max_logs(self, device):
+        """Log storage should drop the oldest entries past MAX_LOGS."""
+        for i in range(device.MAX_LOGS + 5):
+            device.write_register("trip_count", i)
+        assert device.log_count == device.MAX_LOGS
+        assert device.logs[0].level == "DEBUG"
+
     def test_register_write_logged(self, device):
         """Register writes should be logged."""
-        initial_log_count = len(device.logs)
+        initial_log_count = device.log_count
         device.write_register("voltage", 120.0)
-        assert len(device.logs) > initial_log_count
+        logs = device.logs_since(initial_log_count)
+        assert any(log.message == "Register write: voltage" for log in logs)
 
 
 class TestActivateCommand:
@@ -114,6 +184,17 @@ class TestActivateCommand:
         with pytest.raises(CommandExecutionError):
             device.activate()
 
+    def test_rejected_activation_skips_delay(self):
+        """Rejected activation should fail before the activation delay."""
+        clock = VirtualClock(start=1000.0)
+        device = DeviceSimulator(clock=clock)
+        device.activate()
+
+        before = clock.now()
+        with pytest.raises(CommandExecutionError, match="Must be in IDLE state"):
+            device.activate()
+        assert clock.now() == before
+
     def test_activate_from_fault_fails(self, device):
         """Should fail to activate from FAULT state."""
         device.activate()
@@ -129,9 +210,9 @@ class TestActivateCommand:
 
     def test_activate_logged(self, device):
         """Activation should be logged."""
-        initial_log_count = len(device.logs)
+        initial_log_count = device.log_count
         device.activate()
-        logs = device.logs[initial_log_count:]
+        logs = device.logs_since(initial_log_count)
         assert any("activation" in log.message.lower() for log in logs)
 
 
@@ -174,9 +255,9 @@ class TestResetCommand:
     def test_reset_logged(self, device):
         """Reset should be logged."""
         device.activate()
-        initial_log_count = len(device.logs)
+        initial_log_count = device.log_count
         device.reset()
-        logs = device.logs[initial_log_count:]
+        logs = device.logs_since(initial_log_count)
         assert any("reset" in log.message.lower() for log in logs)
 
 
@@ -194,24 +275,15 @@ class TestFaultInjection:
         device.inject_fault("overcurrent")
         assert device.state == DeviceState.FAULT
 
-    def test_overcurrent_fault_sets_registers(self, device):
-        """Overcurrent fault should set appropriate registers."""
-        device.inject_fault("overcurrent")
+    @pytest.mark.parametrize(
+        "fault_type,reg,pred", FAULT_CASES, ids=[case[0] for case in FAULT_CASES]
+    )
+    def test_fault_sets_registers(self, device, fault_type, reg, pred):
+        """Each fault type should set the trip flag and its register."""
+        device.inject_fault(fault_type)
         assert device.get_register("trip_flag") is True
         assert device.get_register("trip_count") >= 1
-        assert device.get_register("current") > 100.0
-
-    def test_overvoltage_fault_sets_registers(self, device):
-        """Overvoltage fault should set appropriate registers."""
-        device.inject_fault("overvoltage")
-        assert device.get_register("trip_flag") is True
-        assert device.get_register("voltage") > 400.0
-
-    def test_temperature_fault_sets_registers(self, device):
-        """Temperature fault should set appropriate registers."""
-        device.inject_fault("temperature")
-        assert device.get_register("trip_flag") is True
-        assert device.get_register("temperature") >= 90.0
+        assert pred(device.get_register(reg))
 
     def test_fault_sets_status_word(self, device):
         """Fault should set bit 7 in status word."""
@@ -230,36 +302,27 @@ class TestFaultInjection:
 
     def test_fault_logged(self, device):
         """Fault injection should be logged."""
-        initial_log_count = len(device.logs)
+        initial_log_count = device.log_count
         device.inject_fault()
-        logs = device.logs[initial_log_count:]
+        logs = device.logs_since(initial_log_count)
         assert any("fault" in log.message.lower() for log in logs)
 
 
 class TestDeviceStatus:
     """Tests for device status reporting."""
 
-    def test_get_status_idle(self, device):
-        """Status should reflect IDLE state."""
-        status = device.get_status()
-        assert status["state"] == "IDLE"
-        assert status["fault_active"] is False
-        assert status["fault_type"] is None
-
-    def test_get_status_active(self, device):
-        """Status should reflect ACTIVE state."""
-        device.activate()
-        status = device.get_status()
-        assert status["state"] == "ACTIVE"
-        assert status["fault_active"] is False
-
-    def test_get_status_fault(self, device):
-        """Status should reflect FAULT state."""
-        device.inject_fault("overcurrent")
+    @pytest.mark.parametrize(
+        "state,setup,fault_active,fault_type",
+        STATUS_CASES,
+        ids=[case[0] for case in STATUS_CASES],
+    )
+    def test_get_status_state(self, device, state, setup, fault_active, fault_type):
+        """Status should reflect the current state and fault info."""
+        setup(device)
         status = device.get_status()
-        assert status["state"] == "FAULT"
-        assert status["fault_active"] is True
-        assert status["fault_type"] == "overcurrent"
+        assert status["state"] == state
+        assert status["fault_active"] is fault_active
+        assert status["fault_type"] == fault_type
 
     def test_get_status_includes_registers(self, device):
         """Status should include register values."""
@@ -283,11 +346,19 @@ class TestStateMachineTransitions:
         # This is implicitly tested - there's no command to go IDLE->FAULT except inject_fault
         assert device.state == DeviceState.IDLE
 
+    def test_state_machine_rejects_activate_when_active(self):
+        """The state machine itself should reject ACTIVE -> ACTIVE."""
+        machine = StateMachine()
+        machine.activate()
+        with pytest.raises(InvalidStateTransitionError):
+            machine.activate()
+        assert machine.can_transition(DeviceState.FAULT, "fault_injected")
+
     def test_state_persistence(self, device):
         """State should persist across operations."""
-        device.write_register("voltage", 100.0)
+        device.write_many({"voltage": 100.0, "current": 5.0})
         assert device.state == DeviceState.IDLE
-        device.write_register("current", 5.0)
+        device.write_many({"frequency": 50.0})
         assert device.state == DeviceState.IDLE
 
     def test_complete_lifecycle(self, device):
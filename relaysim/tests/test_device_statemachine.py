@@ -0,0 +1,90 @@
+"""
+Property-based state machine tests for the device simulator.
+"""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import settings, strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, invariant, rule
+
+from simulator import (
+    CommandExecutionError,
+    DeviceSimulator,
+    DeviceState,
+    VirtualClock,
+)
+
+
+FAULT_TYPES = ["overcurrent", "overvoltage", "temperature"]
+
+
+class DeviceCommandMachine(RuleBasedStateMachine):
+    """Drives random command sequences against a device and a reference model."""
+
+    def __init__(self):
+        super().__init__()
+        self.device = DeviceSimulator(clock=VirtualClock())
+        self.expected_state = DeviceState.IDLE
+        self.expected_trip_count = 0
+
+    @rule()
+    def activate(self):
+        """Activation should only succeed from IDLE."""
+        try:
+            self.device.activate()
+        except CommandExecutionError:
+            assert self.expected_state in (DeviceState.ACTIVE, DeviceState.FAULT)
+        else:
+            assert self.expected_state == DeviceState.IDLE
+            self.expected_state = DeviceState.ACTIVE
+
+    @rule()
+    def reset(self):
+        """Reset should always return the device to IDLE."""
+        self.device.reset()
+        self.expected_state = DeviceState.IDLE
+
+    @rule(fault_type=st.sampled_from(FAULT_TYPES))
+    def inject_fault(self, fault_type):
+        """Fault injection should succeed from any state."""
+        self.device.inject_fault(fault_type)
+        self.expected_state = DeviceState.FAULT
+        self.expected_trip_count += 1
+        assert self.device.get_status()["fault_type"] == fault_type
+
+    @invariant()
+    def state_matches_model(self):
+        """Device state and trip count should follow the reference model."""
+        assert self.device.state == self.expected_state
+        assert self.device.get_register("trip_count") == self.expected_trip_count
+
+    @invariant()
+    def registers_match_state(self):
+        """Status word, trip flag and fault flag should agree with the state."""
+        state = self.device.state
+        status_word = self.device.get_register("status_word")
+        trip_flag = self.device.get_register("trip_flag")
+        fault_active = self.device.get_status()["fault_active"]
+
+        if state == DeviceState.IDLE:
+            assert status_word & 0x0001 == 0x0000
+            assert trip_flag is False
+            assert fault_active is False
+        elif state == DeviceState.ACTIVE:
+            assert status_word & 0x0001 == 0x0001
+            assert trip_flag is False
+            assert fault_active is False
+        else:
+            assert status_word & 0x0080 == 0x0080
+            assert trip_flag is True
+            assert fault_active is True
+
+
+DeviceCommandMachine.TestCase.settings = settings(
+    max_examples=50,
+    stateful_step_count=20,
+    deadline=None,
+)
+TestDeviceCommandMachine = DeviceCommandMachine.TestCase
@@ -8,20 +8,54 @@ from pathlib import Path
 from runner import (
     YAMLScenarioLoader,
     ScenarioLoadError,
+    ScenarioResult,
     ScenarioValidationError,
+    StepResult,
     TestRunner,
 )
 from simulator import DeviceSimulator
 
 
+# Example scenario file -> scenario name
+SCENARIO_NAMES = {
+    "activate": "Basic Activation Test",
+    "fault_injection": "Fault Injection Test",
+    "overvoltage": "Overvoltage Protection Test",
+    "timing_validation": "Timing Validation Test",
+    "temperature_fault": "Temperature Fault Test",
+}
+SCENARIOS = list(SCENARIO_NAMES)
+
+VALID_STEP_TYPES = frozenset({"write", "command", "wait", "assert"})
+
+# Keys every serialized step result must carry
+STEP_RESULT_KEYS = ["step_number", "step_type", "status", "duration_ms"]
+
+# (register, value written first or None, assertion fields, expected status)
+ASSERT_CASES = [
+    ("voltage", 120.0, {"equals": 120.0}, "pass"),
+    ("voltage", 100.0, {"equals": 120.0}, "fail"),
+    ("state", None, {"equals": "IDLE"}, "pass"),
+    ("voltage", 150.0, {"greater_than": 100.0}, "pass"),
+    ("voltage", 50.0, {"less_than": 100.0}, "pass"),
+    ("trip_flag", False, {"equals": False}, "pass"),
+]
+
+
 class TestYAMLScenarioLoader:
     """Tests for YAML scenario loading."""
 
-    def test_load_activate_scenario(self, scenario_loader):
-        """Should successfully load activate scenario."""
-        scenario = scenario_loader.load_scenario("activate")
-        assert scenario["name"] == "Basic Activation Test"
+    @pytest.mark.parametrize("name,expected_name", SCENARIO_NAMES.items(), ids=SCENARIOS)
+    def test_scenario_file_invariants(self, scenario_loader, name, expected_name):
+        """Each example scenario should load with required fields and valid steps."""
+        scenario = scenario_loader.load_scenario(name)
+        assert scenario.keys() >= {"name", "description", "steps"}
+        assert scenario["name"] == expected_name
+        assert isinstance(scenario["steps"], (list, tuple))
         assert len(scenario["steps"]) > 0
+        for step in scenario["steps"]:
+            assert step["step"] in VALID_STEP_TYPES
+        assert scenario_loader.validate_scenario_file(name) is True
 
     def test_load_fault_injection_scenario(self, scenario_loader):
         """Should successfully load fault injection scenario."""
@@ -42,92 +76,106 @@ class TestYAMLScenarioLoader:
         assert all("description" in s for s in scenarios)
         assert all("filename" in s for s in scenarios)
 
-    def test_scenario_has_required_fields(self, scenario_loader):
-        """Loaded scenario should have required fields."""
-        scenario = scenario_loader.load_scenario("activate")
-        assert "name" in scenario
-        assert "description" in scenario
-        assert "steps" in scenario
-        assert isinstance(scenario["steps"], list)
-
-    def test_validate_scenario_file(self, scenario_loader):
-        """Should validate scenario file structure."""
-        assert scenario_loader.validate_scenario_file("activate") is True
-
-    def test_scenario_steps_structure(self, scenario_loader):
-        """Steps should have valid structure."""
+    def test_list_scenarios_matches_full_load(self, scenario_loader):
+        """Listed metadata should match a full load of each scenario."""
+        for listed in scenario_loader.list_scenarios():
+            scenario = scenario_loader.load_scenario(listed["filename"])
+            assert listed["name"] == scenario["name"]
+            assert listed["description"] == scenario["description"]
+
+    def test_list_scenarios_reads_description_after_steps(self, tmp_path):
+        """Metadata placed after the steps should still be listed."""
+        (tmp_path / "late.yaml").write_text(
+            'name: "Late"\n'
+            "steps:\n"
+            "  - step: wait\n"
+            "    ms: 1\n"
+            'description: "Described after the steps"\n'
+        )
+        loader = YAMLScenarioLoader(str(tmp_path))
+        [listed] = loader.list_scenarios()
+        assert listed["name"] == "Late"
+        assert listed["description"] == "Described after the steps"
+
+    def test_modified_scenario_is_reloaded(self, tmp_path):
+        """Editing a scenario file should invalidate the parse cache."""
+        import os
+
+        scenario_file = tmp_path / "edited.yaml"
+        scenario_file.write_text('name: "Before"\nsteps:\n  - step: wait\n    ms: 1\n')
+        loader = YAMLScenarioLoader(str(tmp_path))
+        assert loader.load_scenario("edited")["name"] == "Before"
+
+        scenario_file.write_text('name: "After"\nsteps:\n  - step: wait\n    ms: 1\n')
+        stat = scenario_file.stat()
+        os.utime(scenario_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert loader.load_scenario("edited")["name"] == "After"
+
+    @pytest.mark.parametrize("steps", [
+        [{"register": "voltage", "value": 1.0}],
+        [{"step": "teleport"}],
+        [{"step": "write", "register": "voltage"}],
+        [{"step": "assert", "register": "voltage"}],
+    ])
+    def test_invalid_steps_rejected(self, scenario_loader, steps):
+        """Malformed steps should fail validation."""
+        with pytest.raises(ScenarioValidationError):
+            scenario_loader._validate_steps(steps)
+
+    def test_loaded_scenario_is_read_only(self, scenario_loader):
+        """Loaded scenarios are shared, so they should reject mutation."""
         scenario = scenario_loader.load_scenario("activate")
-        for step in scenario["steps"]:
-            assert "step" in step
-            assert step["step"] in ["write", "command", "wait", "assert"]
+        with pytest.raises(TypeError):
+            scenario["name"] = "changed"
+        with pytest.raises(TypeError):
+            scenario["steps"][0]["step"] = "wait"
+        # Frozen steps still pass validation
+        scenario_loader._validate_steps(scenario["steps"])
 
 
 class TestScenarioExecution:
     """Tests for scenario execution."""
 
-    def test_run_activate_scenario(self, runner):
-        """Should successfully run activate scenario."""
-        result = runner.run_scenario("activate")
-        assert result.overall_status == "passed"
-        assert result.failed_steps == 0
-
-    def test_run_fault_injection_scenario(self, runner):
-        """Should successfully run fault injection scenario."""
-        result = runner.run_scenario("fault_injection")
-        assert result.overall_status == "passed"
-        assert result.failed_steps == 0
-
-    def test_run_overvoltage_scenario(self, runner):
-        """Should successfully run overvoltage scenario."""
-        result = runner.run_scenario("overvoltage")
-        assert result.overall_status == "passed"
-        assert result.failed_steps == 0
-
-    def test_run_timing_validation_scenario(self, runner):
-        """Should successfully run timing validation scenario."""
-        result = runner.run_scenario("timing_validation")
-        assert result.overall_status == "passed"
-        assert result.failed_steps == 0
-
-    def test_run_temperature_fault_scenario(self, runner):
-        """Should successfully run temperature fault scenario."""
-        result = runner.run_scenario("temperature_fault")
+    @pytest.mark.parametrize("name", SCENARIOS)
+    def test_run_scenario(self, runner_factory, name):
+        """Should successfully run each example scenario."""
+        result = runner_factory().run_scenario(name)
         assert result.overall_status == "passed"
         assert result.failed_steps == 0
 
-    def test_scenario_result_has_metadata(self, runner):
+    def test_scenario_result_has_metadata(self, activate_result):
         """Result should contain scenario metadata."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         assert result.scenario_name
         assert result.run_id
         assert result.start_time is not None
         assert result.end_time is not None
 
-    def test_scenario_result_has_step_results(self, runner):
+    def test_scenario_result_has_step_results(self, activate_result):
         """Result should contain individual step results."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         assert len(result.step_results) > 0
         for step_result in result.step_results:
             assert step_result.step_number > 0
             assert step_result.step_type
             assert step_result.status in ["pass", "fail", "error"]
 
-    def test_passed_scenario_all_steps_pass(self, runner):
+    def test_passed_scenario_all_steps_pass(self, activate_result):
         """In a passed scenario, all steps should pass."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         assert result.overall_status == "passed"
         assert all(sr.status == "pass" for sr in result.step_results)
 
-    def test_scenario_duration_recorded(self, runner):
+    def test_scenario_duration_recorded(self, activate_result):
         """Scenario duration should be recorded."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         assert result.duration_seconds > 0
         # Should complete in reasonable time (< 5 seconds)
         assert result.duration_seconds < 5.0
 
-    def test_step_duration_recorded(self, runner):
+    def test_step_duration_recorded(self, activate_result):
         """Individual step durations should be recorded."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         for step_result in result.step_results:
             assert step_result.duration_ms >= 0
 
@@ -145,9 +193,9 @@ class TestWriteSteps:
         device.write_register("voltage", 120.0)
         assert device.get_register("voltage") == 120.0
 
-    def test_write_multiple_registers(self, runner):
+    def test_write_multiple_registers(self, activate_result):
         """Should handle writing multiple registers."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         # activate.yaml writes voltage and current
         assert result.overall_status == "passed"
 
@@ -155,38 +203,31 @@ class TestWriteSteps:
 class TestCommandSteps:
     """Tests for command step execution."""
 
-    def test_activate_command_step(self, runner):
+    def test_activate_command_step(self, device, runner):
         """Activate command should change state."""
-        device = DeviceSimulator()
-        runner_instance = TestRunner(device)
-
         # Execute step
         step = {"step": "command", "action": "activate"}
-        step_result = runner_instance._execute_step(1, step)
+        step_result = runner._execute_step(1, step)
 
         assert step_result.status == "pass"
         assert device.state.value == "ACTIVE"
 
-    def test_reset_command_step(self, runner):
+    def test_reset_command_step(self, device, runner):
         """Reset command should change state to IDLE."""
-        device = DeviceSimulator()
         device.activate()
-        runner_instance = TestRunner(device)
 
         step = {"step": "command", "action": "reset"}
-        step_result = runner_instance._execute_step(1, step)
+        step_result = runner._execute_step(1, step)
 
         assert step_result.status == "pass"
         assert device.state.value == "IDLE"
 
-    def test_inject_fault_command_step(self, runner):
+    def test_inject_fault_command_step(self, device, runner):
         """Inject fault command should change state to FAULT."""
-        device = DeviceSimulator()
         device.activate()
-        runner_instance = TestRunner(device)
 
         step = {"step": "command", "action": "inject_fault", "fault_type": "overcurrent"}
-        step_result = runner_instance._execute_step(1, step)
+        step_result = runner._execute_step(1, step)
 
         assert step_result.status == "pass"
         assert device.state.value == "FAULT"
@@ -195,89 +236,44 @@ class TestCommandSteps:
 class TestWaitSteps:
     """Tests for wait step execution."""
 
-    def test_wait_step_delays(self, runner):
-        """Wait step should introduce delay."""
-        import time
-        device = DeviceSimulator()
-        runner_instance = TestRunner(device)
+    def test_wait_step_delays(self, runner, monkeypatch):
+        """Wait step should sleep for the requested duration."""
+        calls = []
+        monkeypatch.setattr("runner.test_runner.time.sleep", calls.append)
 
         step = {"step": "wait", "ms": 100}
-
-        start = time.time()
-        step_result = runner_instance._execute_step(1, step)
-        duration = time.time() - start
+        step_result = runner._execute_step(1, step)
 
         assert step_result.status == "pass"
-        assert duration >= 0.1  # At least 100ms
+        assert calls and calls[0] >= 0.1  # At least 100ms
 
 
 class TestAssertSteps:
     """Tests for assert step execution."""
 
-    def test_assert_equals_pass(self, runner):
-        """Assert equals should pass when values match."""
-        device = DeviceSimulator()
-        device.write_register("voltage", 120.0)
+    @pytest.mark.parametrize(
+        "register,value,assertion,expected",
+        ASSERT_CASES,
+        ids=[
+            "equals_pass",
+            "equals_fail",
+            "state",
+            "greater_than",
+            "less_than",
+            "boolean",
+        ],
+    )
+    def test_assert_step(self, device_factory, register, value, assertion, expected):
+        """Assert steps should compare the register against the expectation."""
+        device = device_factory()
+        if value is not None:
+            device.write_register(register, value)
         runner_instance = TestRunner(device)
 
-        step = {"step": "assert", "register": "voltage", "equals": 120.0}
+        step = {"step": "assert", "register": register, **assertion}
         step_result = runner_instance._execute_step(1, step)
 
-        assert step_result.status == "pass"
-
-    def test_assert_equals_fail(self, runner):
-        """Assert equals should fail when values don't match."""
-        device = DeviceSimulator()
-        device.write_register("voltage", 100.0)
-        runner_instance = TestRunner(device)
-
-        step = {"step": "assert", "register": "voltage", "equals": 120.0}
-        step_result = runner_instance._execute_step(1, step)
-
-        assert step_result.status == "fail"
-
-    def test_assert_state(self, runner):
-        """Should be able to assert device state."""
-        device = DeviceSimulator()
-        runner_instance = TestRunner(device)
-
-        step = {"step": "assert", "register": "state", "equals": "IDLE"}
-        step_result = runner_instance._execute_step(1, step)
-
-        assert step_result.status == "pass"
-
-    def test_assert_greater_than(self, runner):
-        """Assert greater_than should work correctly."""
-        device = DeviceSimulator()
-        device.write_register("voltage", 150.0)
-        runner_instance = TestRunner(device)
-
-        step = {"step": "assert", "register": "voltage", "greater_than": 100.0}
-        step_result = runner_instance._execute_step(1, step)
-
-        assert step_result.status == "pass"
-
-    def test_assert_less_than(self, runner):
-        """Assert less_than should work correctly."""
-        device = DeviceSimulator()
-        device.write_register("voltage", 50.0)
-        runner_instance = TestRunner(device)
-
-        step = {"step": "assert", "register": "voltage", "less_than": 100.0}
-        step_result = runner_instance._execute_step(1, step)
-
-        assert step_result.status == "pass"
-
-    def test_assert_boolean(self, runner):
-        """Should be able to assert boolean registers."""
-        device = DeviceSimulator()
-        device.write_register("trip_flag", False)
-        runner_instance = TestRunner(device)
-
-        step = {"step": "assert", "register": "trip_flag", "equals": False}
-        step_result = runner_instance._execute_step(1, step)
-
-        assert step_result.status == "pass"
+        assert step_result.status == expected
 
 
 class TestFailureScenarios:
@@ -311,10 +307,11 @@ class TestFailureScenarios:
 class TestBatchExecution:
     """Tests for batch scenario execution."""
 
-    def test_run_batch_scenarios(self, runner):
-        """Should successfully run multiple scenarios."""
+    @pytest.mark.benchmark(group="batch", min_rounds=5)
+    def test_run_batch_scenarios(self, benchmark, runner):
+        """Should successfully run multiple scenarios, timed for regressions."""
         scenarios = ["activate", "fault_injection"]
-        results = runner.run_batch(scenarios)
+        results = benchmark(runner.run_batch, scenarios)
 
         assert len(results) == 2
         assert all(r.overall_status == "passed" for r in results)
@@ -331,9 +328,9 @@ class TestBatchExecution:
 class TestScenarioResultConversion:
     """Tests for scenario result data conversion."""
 
-    def test_result_to_dict(self, runner):
+    def test_result_to_dict(self, activate_result):
         """Should convert result to dictionary."""
-        result = runner.run_scenario("activate")
+        result = activate_result
         result_dict = result.to_dict()
 
         assert isinstance(result_dict, dict)
@@ -342,13 +339,57 @@ class TestScenarioResultConversion:
         assert "overall_status" in result_dict
         assert "step_results" in result_dict
 
-    def test_step_result_to_dict(self, runner):
-        """Step results should convert to dictionaries."""
-        result = runner.run_scenario("activate")
+    @pytest.mark.parametrize("key", STEP_RESULT_KEYS, ids=STEP_RESULT_KEYS)
+    def test_step_result_to_dict(self, activate_result, key):
+        """Step results should convert to dictionaries with each expected key."""
+        result = activate_result
         result_dict = result.to_dict()
 
         for step_dict in result_dict["step_results"]:
-            assert "step_number" in step_dict
-            assert "step_type" in step_dict
-            assert "status" in step_dict
-            assert "duration_ms" in step_dict
+            assert key in step_dict
+
+    def test_finalized_result_serialization_is_cached(self, runner):
+        """Finalized results should reuse their serialized payload."""
+        import json
+
+        result = runner.run_scenario("activate")
+        first = result.to_dict()
+        first["report_version"] = "1.0"
+
+        assert "report_version" not in result.to_dict()
+        assert result.to_json_bytes() is result.to_json_bytes()
+        assert json.loads(result.to_json_bytes()) == result.to_dict()
+
+    @pytest.mark.parametrize("extra", [
+        "tags: !!set {smoke, fast}",
+        "meta: {1: one}",
+        "blob: !!binary aGVsbG8=",
+    ], ids=["set_value", "int_key", "binary_value"])
+    def test_non_json_step_values_serialize(self, tmp_path, runner, extra):
+        """Step values YAML can express but JSON cannot should not fail the run."""
+        import json
+
+        (tmp_path / "tagged.yaml").write_text(
+            'name: "Tagged"\n'
+            "steps:\n"
+            "  - step: wait\n"
+            "    ms: 1\n"
+            f"    {extra}\n"
+        )
+        runner.loader = YAMLScenarioLoader(str(tmp_path))
+        result = runner.run_scenario("tagged")
+
+        assert result.overall_status == "passed"
+        payload = json.loads(result.to_json_bytes())
+        key = extra.split(":")[0]
+        assert payload["step_results"][0]["details"][key]
+
+    def test_step_counts_track_added_results(self):
+        """Passed/failed counts should follow added step results."""
+        result = ScenarioResult("counts")
+        for i, status in enumerate(["pass", "pass", "fail", "error"], start=1):
+            result.add_step_result(StepResult(i, "assert", status))
+
+        assert result.passed_steps == 2
+        assert result.failed_steps == 2
+        assert result.to_dict()["total_steps"] == 4
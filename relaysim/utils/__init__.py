@@ -1,5 +1,6 @@
 """Utilities package."""
 
 from .logger import get_logger, setup_logger
+from .serialization import json_default
 
-__all__ = ["get_logger", "setup_logger"]
+__all__ = ["get_logger", "setup_logger", "json_default"]
@@ -3,8 +3,34 @@ Centralized logging utility for Relaysim.
 """
 
 import logging
+import os
 import sys
-from typing import Optional
+from logging.handlers import MemoryHandler
+from typing import Dict, Optional, Tuple
+
+
+# Log level names accepted by setup_logger
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Format: [2024-01-15 10:30:45] INFO: Message
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Records buffered before a file handler writes them out
+FILE_BUFFER_CAPACITY = 1024
+
+# Configured loggers keyed by (name, level, log_file)
+_LOGGER_CACHE: Dict[Tuple[str, str, Optional[str]], logging.Logger] = {}
+
+
+def _console_output_suppressed() -> bool:
+    """Check whether RELAYSIM_QUIET_CONSOLE=1 asks to drop console output."""
+    return os.environ.get("RELAYSIM_QUIET_CONSOLE") == "1"
 
 
 def setup_logger(
@@ -15,6 +41,13 @@ def setup_logger(
     """
     Set up a logger with console and optional file output.
 
+    Repeated calls with the same configuration return the already
+    configured logger without rebuilding its handlers. File output is
+    buffered and written when the buffer fills, on ERROR records, when the
+    logger is reconfigured, or at interpreter exit via logging.shutdown.
+    Setting RELAYSIM_QUIET_CONSOLE=1 replaces the console handler with a
+    NullHandler.
+
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -22,35 +55,58 @@ def setup_logger(
 
     Returns:
         Configured logger instance
+
+    Raises:
+        KeyError: If level is not a known log level name
     """
+    key = (name, level.upper(), log_file)
+    cached = _LOGGER_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    log_level = _LEVELS[key[1]]
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
 
-    # Clear any existing handlers
+    # Close existing handlers; a MemoryHandler flushes its buffer on close
+    # but leaves its target open, so close that as well
+    for handler in logger.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
     logger.handlers.clear()
 
     # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-
-    # Format: [2024-01-15 10:30:45] INFO: Message
-    formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    if _console_output_suppressed():
+        logger.addHandler(logging.NullHandler())
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        console_handler.setFormatter(_FORMATTER)
+        logger.addHandler(console_handler)
 
     # File handler (optional)
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_handler.setFormatter(formatter)
+        target = logging.FileHandler(log_file)
+        target.setLevel(log_level)
+        target.setFormatter(_FORMATTER)
+        file_handler = MemoryHandler(
+            capacity=FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=target,
+        )
+        file_handler.setLevel(log_level)
         logger.addHandler(file_handler)
 
     # Prevent propagation to root logger
     logger.propagate = False
 
+    # Handlers were rebuilt, so other cached configurations of this logger are stale
+    for stale_key in [k for k in _LOGGER_CACHE if k[0] == name]:
+        del _LOGGER_CACHE[stale_key]
+    _LOGGER_CACHE[key] = logger
+
     return logger
 
 
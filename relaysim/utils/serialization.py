@@ -0,0 +1,32 @@
+"""
+JSON serialization helpers for Relaysim.
+"""
+
+import base64
+from pathlib import PurePath
+from typing import Any
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Serialize types orjson does not handle natively.
+
+    Covers paths and the extra value types YAML tags can produce: sets
+    (``!!set``) become lists and bytes (``!!binary``) become base64 strings.
+
+    Args:
+        obj: Object orjson could not serialize
+
+    Returns:
+        JSON-compatible replacement value
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")